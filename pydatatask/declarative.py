@@ -1,22 +1,30 @@
 """This module contains parsing methods for transforming various dict and list schemas into Repository, Task, and
 other kinds of pydatatask classes."""
-from typing import Any, Callable, Dict, List, Mapping, Optional, Type, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
 from datetime import timedelta
 from enum import Enum
 import base64
-import gc
+import copy
+import functools
 import json
 import os
 import socket
 import sys
 import traceback
 
-from importlib_metadata import entry_points
-from motor.core import AgnosticClient
-import aiobotocore.session
-import asyncssh
-import docker_registry_client_async
-import motor.motor_asyncio
+from importlib_metadata import EntryPoint, entry_points
 
 from pydatatask.executor import Executor
 from pydatatask.executor.container_manager import DockerContainerManager
@@ -44,22 +52,57 @@ from pydatatask.session import Ephemeral
 from pydatatask.task import ContainerTask, KubeTask, LinkKind, ProcessTask, Task
 import pydatatask
 
+if TYPE_CHECKING:
+    from motor.core import AgnosticClient
+
 _T = TypeVar("_T")
 
 
+@functools.lru_cache(maxsize=None)
+def _cached_entry_points(group: str) -> Tuple[EntryPoint, ...]:
+    """Look up the entry points for a group, scanning the installed distributions only once per process."""
+    return tuple(entry_points(group=group))
+
+
+_loaded_entry_points: Dict[EntryPoint, Any] = {}
+
+
+def _load_entry_point(ep: EntryPoint) -> Any:
+    """Load an entry point, reusing the result if it has been loaded before.
+
+    The cache is keyed on the whole entry point, since several plugins may register the same name in a group.
+    """
+    try:
+        return _loaded_entry_points[ep]
+    except KeyError:
+        result = _loaded_entry_points[ep] = ep.load()
+        return result
+
+
+_BOOL_MAP: Mapping[str, bool] = {
+    "yes": True,
+    "y": True,
+    "1": True,
+    "true": True,
+    "no": False,
+    "n": False,
+    "0": False,
+    "false": False,
+}
+
+
 def parse_bool(thing: Any) -> bool:
     """Parse a string, int, or bool into a bool."""
-    if isinstance(thing, bool):
+    if thing is True or thing is False:
         return thing
-    if isinstance(thing, int):
+    if type(thing) is int:
         return bool(thing)
-    if isinstance(thing, str):
-        if thing.lower() in ("yes", "y", "1", "true"):
-            return True
-        if thing.lower() in ("no", "n", "0", "false"):
-            return False
-        raise ValueError(f"Invalid bool value {thing}")
-    raise ValueError(f"{type(thing)} is not valid as a bool")
+    try:
+        return _BOOL_MAP[thing.lower()]
+    except AttributeError:
+        raise ValueError(f"{type(thing)} is not valid as a bool") from None
+    except KeyError:
+        raise ValueError(f"Invalid bool value {thing}") from None
 
 
 _E = TypeVar("_E", bound=Enum)
@@ -67,13 +110,17 @@ _E = TypeVar("_E", bound=Enum)
 
 def make_enum_constructor(cls: Type[_E]) -> Callable[[Any], Optional[_E]]:
     """Parse a string into an enum."""
+    members = cls.__members__
 
     def inner(thing):
         if thing is None:
             return None
-        if not isinstance(thing, str):
-            raise ValueError(f"{cls} must be instantiated by a string")
-        return getattr(cls, thing)
+        try:
+            return members[thing]
+        except (KeyError, TypeError):
+            if not isinstance(thing, str):
+                raise ValueError(f"{cls} must be instantiated by a string") from None
+            raise ValueError(f"{thing} is not a valid member of {cls}") from None
 
     return inner
 
@@ -92,17 +139,16 @@ def make_constructor(name: str, constructor: Callable[..., _T], schema: Dict[str
 def make_typeddict_constructor(name: str, schema: Dict[str, Any]) -> Callable[[Any], Dict[str, Any]]:
     """Generate a dict constructor function, or a function which will take a dict of parameters, validate and
     transform them according to a schema, and return that dict."""
+    allowed = frozenset(schema)
 
     def inner(thing):
-        if not isinstance(thing, dict):
+        if type(thing) is not dict:
             raise ValueError(f"{name} must be followed by a mapping")
-
-        kwargs = {}
-        for k, v in thing.items():
-            if k not in schema:
-                raise ValueError(f"Invalid argument to {name}: {k}")
-            kwargs[k] = schema[k](v)
-        return kwargs
+        bad = thing.keys() - allowed
+        if bad:
+            k = next(k for k in thing if k in bad)
+            raise ValueError(f"Invalid argument to {name}: {k}")
+        return {k: schema[k](v) for k, v in thing.items()}
 
     return inner
 
@@ -115,16 +161,17 @@ def make_dispatcher(name: str, mapping: Dict[str, Callable[[Any], _T]]) -> Calla
     """
 
     def inner(thing):
-        if not isinstance(thing, dict):
-            raise ValueError(f"{name} must be a mapping")
-        if "cls" not in thing:
-            raise ValueError(f"You must provide the cls name for {name}")
-        key = thing["cls"]
-        value = thing.get("args", {})
-        constructor = mapping.get(key, None)
-        if constructor is None:
-            raise ValueError(f"{key} is not a valid member of {name}")
-        return constructor(value)
+        try:
+            key = thing["cls"]
+        except (TypeError, KeyError):
+            if type(thing) is not dict:
+                raise ValueError(f"{name} must be a mapping") from None
+            raise ValueError(f"You must provide the cls name for {name}") from None
+        try:
+            constructor = mapping[key]
+        except (TypeError, KeyError):
+            raise ValueError(f"{key} is not a valid member of {name}") from None
+        return constructor(thing.get("args", {}))
 
     return inner
 
@@ -135,10 +182,19 @@ def make_dict_parser(
     """Generate a dict parser function, or a function which validates and transforms the keys and values of a dict
     into another dict."""
 
-    def inner(thing):
-        if not isinstance(thing, dict):
-            raise ValueError(f"{name} must be a dict")
-        return {key_parser(key): value_parser(value) for key, value in thing.items()}
+    if key_parser is str:
+        # Keys coming out of yaml are almost always strings already, so skip the call for those.
+        def inner(thing):
+            if type(thing) is not dict:
+                raise ValueError(f"{name} must be a dict")
+            return {key if type(key) is str else str(key): value_parser(value) for key, value in thing.items()}
+
+    else:
+
+        def inner(thing):
+            if type(thing) is not dict:
+                raise ValueError(f"{name} must be a dict")
+            return {key_parser(key): value_parser(value) for key, value in thing.items()}
 
     return inner
 
@@ -148,13 +204,16 @@ def make_list_parser(name: str, value_parser: Callable[[Any], _T]) -> Callable[[
     another list."""
 
     def inner(thing):
-        if not isinstance(thing, list):
+        if type(thing) is not list:
             raise ValueError(f"{name} must be a list")
-        return [value_parser(value) for value in thing]
+        return list(map(value_parser, thing))
 
     return inner
 
 
+_MISSING = object()
+
+
 def make_picker(name: str, options: Mapping[str, _T]) -> Callable[[Any], Optional[_T]]:
     """Generate a picker function, or a function which takes a string and returns one of the members of the provided
     options dict."""
@@ -162,19 +221,25 @@ def make_picker(name: str, options: Mapping[str, _T]) -> Callable[[Any], Optiona
     def inner(thing):
         if thing is None:
             return None
-        if not options:
-            raise ValueError(f"Must provide at least one {name}")
-        if not isinstance(thing, str):
-            raise ValueError(f"When picking a {name}, must provide a str")
-        if thing not in options:
+        try:
+            result = options.get(thing, _MISSING)
+        except TypeError:
+            result = _MISSING
+        if result is _MISSING:
+            if not options:
+                raise ValueError(f"Must provide at least one {name}")
+            if not isinstance(thing, str):
+                raise ValueError(f"When picking a {name}, must provide a str")
             raise ValueError(f"{thing} is not a valid option for {options}, you want e.g. {next(iter(options))}")
-        return options[thing]
+        return result
 
     return inner
 
 
 def _build_s3_connection(endpoint: str, username: str, password: str):
     async def minio():
+        import aiobotocore.session  # pylint: disable=import-outside-toplevel
+
         minio_session = aiobotocore.session.get_session()
         async with minio_session.create_client(
             "s3",
@@ -187,6 +252,16 @@ def _build_s3_connection(endpoint: str, username: str, password: str):
     return minio
 
 
+@functools.lru_cache(maxsize=16)
+def _load_docker_config(config_file: str, mtime_ns: int) -> Dict[str, Any]:  # pylint: disable=unused-argument
+    """Load a docker config file.
+
+    The modification time is part of the cache key so that edits to the file are picked up.
+    """
+    with open(config_file, "r", encoding="utf-8") as fp:
+        return json.load(fp)
+
+
 def _build_docker_connection(
     domain: str,
     username: Optional[str] = None,
@@ -197,32 +272,35 @@ def _build_docker_connection(
     if default_config_file:
         config_file = os.path.expanduser("~/.docker/config.json")
     if config_file is not None:
-        with open(config_file, "r", encoding="utf-8") as fp:
-            docker_config = json.load(fp)
+        docker_config = _load_docker_config(config_file, os.stat(config_file).st_mtime_ns)
         username, password = base64.b64decode(docker_config["auths"][domain]["auth"]).decode().split(":")
     else:
         if username is None or password is None:
             raise ValueError("Must provide username and password or a config file for DockerRegistry")
+    credentials = base64.b64encode(f"{username}:{password}".encode()).decode()
 
     async def docker():
+        import docker_registry_client_async  # pylint: disable=import-outside-toplevel
+
         registry = docker_registry_client_async.DockerRegistryClientAsync(
             client_session_kwargs={"connector_owner": True},
             tcp_connector_kwargs={"family": socket.AF_INET},
             ssl=True,
         )
         await registry.add_credentials(
-            credentials=base64.b64encode(f"{username}:{password}".encode()).decode(),
+            credentials=credentials,
             endpoint=domain,
         )
         yield registry
         await registry.close()
-        gc.collect()
 
     return docker
 
 
 def _build_mongo_connection(url: str, database: str):
     async def mongo():
+        import motor.motor_asyncio  # pylint: disable=import-outside-toplevel
+
         client: "AgnosticClient[Any]" = motor.motor_asyncio.AsyncIOMotorClient(url)
         collection = client.get_database(database)
         yield collection
@@ -234,6 +312,8 @@ def _build_ssh_connection(
     hostname: str, username: str, password: Optional[str] = None, key: Optional[str] = None, port: int = 22
 ):
     async def ssh():
+        import asyncssh  # pylint: disable=import-outside-toplevel
+
         async with asyncssh.connect(
             hostname,
             port=port,
@@ -247,11 +327,50 @@ def _build_ssh_connection(
     return ssh
 
 
-quota_constructor = make_constructor("quota", Quota.parse, {"cpu": str, "mem": str, "launches": str})
-timedelta_constructor = make_constructor(
-    "timedelta",
-    timedelta,
-    {"days": int, "seconds": int, "microseconds": int, "milliseconds": int, "minutes": int, "hours": int, "weeks": int},
+def _memoize_mapping_parser(parser: Callable[[Any], _T], copy_result: bool = False) -> Callable[[Any], _T]:
+    """Wrap a parser of flat mappings so that parsing a mapping equal to a previously parsed one reuses the previous
+    result.
+
+    Values are keyed along with their types, since values which compare equal (e.g. ``True`` and ``1``) may parse
+    differently. Mappings with unhashable values, or inputs which are not dicts at all, are passed through uncached. If
+    the result is mutable, set ``copy_result`` so that each caller gets its own shallow copy.
+    """
+
+    @functools.lru_cache(maxsize=256)
+    def cached(items: FrozenSet[Tuple[Any, type, Any]]) -> _T:
+        return parser({k: v for k, _, v in items})
+
+    def inner(thing):
+        if type(thing) is not dict:
+            return parser(thing)
+        try:
+            key = frozenset((k, type(v), v) for k, v in thing.items())
+        except TypeError:
+            return parser(thing)
+        result = cached(key)
+        return copy.copy(result) if copy_result else result
+
+    return inner
+
+
+quota_constructor = _memoize_mapping_parser(
+    make_constructor("quota", Quota.parse, {"cpu": str, "mem": str, "launches": str}),
+    copy_result=True,
+)
+timedelta_constructor = _memoize_mapping_parser(
+    make_constructor(
+        "timedelta",
+        timedelta,
+        {
+            "days": int,
+            "seconds": int,
+            "microseconds": int,
+            "milliseconds": int,
+            "minutes": int,
+            "hours": int,
+            "weeks": int,
+        },
+    )
 )
 
 
@@ -267,8 +386,51 @@ def make_annotated_constructor(
         result.annotations.update(annotations)  # type: ignore
         return result
 
-    schema["annotations"] = lambda x: x
-    return make_constructor(name, inner_constructor, schema)
+    return make_constructor(name, inner_constructor, {**schema, "annotations": lambda x: x})
+
+
+_LOCAL_REPOSITORY_SCHEMA: Dict[str, Any] = {
+    "basedir": str,
+    "extension": str,
+    "case_insensitive": parse_bool,
+}
+_REPOSITORY_CONSTRUCTORS: Dict[str, Callable[[Any], Repository]] = {
+    "InProcessMetadata": make_annotated_constructor(
+        "InProcessMetadataRepository",
+        InProcessMetadataRepository,
+        {},
+    ),
+    "InProcessBlob": make_annotated_constructor(
+        "InProcessBlobRepository",
+        InProcessBlobRepository,
+        {},
+    ),
+    "File": make_annotated_constructor(
+        "FileRepository",
+        FileRepository,
+        _LOCAL_REPOSITORY_SCHEMA,
+    ),
+    "Directory": make_annotated_constructor(
+        "DirectoryRepository",
+        DirectoryRepository,
+        {
+            **_LOCAL_REPOSITORY_SCHEMA,
+            "discard_empty": parse_bool,
+        },
+    ),
+    "YamlFile": make_annotated_constructor(
+        "YamlMetadataFileRepository",
+        YamlMetadataFileRepository,
+        _LOCAL_REPOSITORY_SCHEMA,
+    ),
+}
+_S3_REPOSITORY_SCHEMA: Dict[str, Any] = {
+    "bucket": str,
+    "prefix": str,
+    "suffix": str,
+    "mimetype": str,
+    "incluster_endpoint": str,
+}
 
 
 def build_repository_picker(ephemerals: Dict[str, Callable[[], Any]]) -> Callable[[Any], Repository]:
@@ -276,68 +438,18 @@ def build_repository_picker(ephemerals: Dict[str, Callable[[], Any]]) -> Callabl
 
     This function can be extended through the ``pydatatask.repository_constructors`` entrypoint.
     """
+    s3_schema = {**_S3_REPOSITORY_SCHEMA, "client": make_picker("S3Connection", ephemerals)}
     kinds: Dict[str, Callable[[Any], Repository]] = {
-        "InProcessMetadata": make_annotated_constructor(
-            "InProcessMetadataRepository",
-            InProcessMetadataRepository,
-            {},
-        ),
-        "InProcessBlob": make_annotated_constructor(
-            "InProcessBlobRepository",
-            InProcessBlobRepository,
-            {},
-        ),
-        "File": make_annotated_constructor(
-            "FileRepository",
-            FileRepository,
-            {
-                "basedir": str,
-                "extension": str,
-                "case_insensitive": parse_bool,
-            },
-        ),
-        "Directory": make_annotated_constructor(
-            "DirectoryRepository",
-            DirectoryRepository,
-            {
-                "basedir": str,
-                "extension": str,
-                "case_insensitive": parse_bool,
-                "discard_empty": parse_bool,
-            },
-        ),
-        "YamlFile": make_annotated_constructor(
-            "YamlMetadataFileRepository",
-            YamlMetadataFileRepository,
-            {
-                "basedir": str,
-                "extension": str,
-                "case_insensitive": parse_bool,
-            },
-        ),
+        **_REPOSITORY_CONSTRUCTORS,
         "S3Bucket": make_annotated_constructor(
             "S3BucketRepository",
             S3BucketRepository,
-            {
-                "client": make_picker("S3Connection", ephemerals),
-                "bucket": str,
-                "prefix": str,
-                "suffix": str,
-                "mimetype": str,
-                "incluster_endpoint": str,
-            },
+            s3_schema,
         ),
         "YamlMetadataS3Bucket": make_annotated_constructor(
             "YamlMetadataS3Repository",
             YamlMetadataS3Repository,
-            {
-                "client": make_picker("S3Connection", ephemerals),
-                "bucket": str,
-                "prefix": str,
-                "suffix": str,
-                "mimetype": str,
-                "incluster_endpoint": str,
-            },
+            s3_schema,
         ),
         "DockerRegistry": make_annotated_constructor(
             "DockerRepository",
@@ -357,8 +469,8 @@ def build_repository_picker(ephemerals: Dict[str, Callable[[], Any]]) -> Callabl
             },
         ),
     }
-    for ep in entry_points(group="pydatatask.repository_constructors"):
-        maker = ep.load()
+    for ep in _cached_entry_points("pydatatask.repository_constructors"):
+        maker = _load_entry_point(ep)
         try:
             kinds.update(maker(ephemerals))
         except TypeError:
@@ -366,33 +478,39 @@ def build_repository_picker(ephemerals: Dict[str, Callable[[], Any]]) -> Callabl
     return make_dispatcher("Repository", kinds)
 
 
+_EXECUTOR_CONSTRUCTORS: Dict[str, Callable[[Any], Executor]] = {
+    "TempLinux": make_constructor(
+        "InProcessLocalLinuxManager",
+        InProcessLocalLinuxManager,
+        {
+            "app": str,
+            "local_path": str,
+        },
+    ),
+    "LocalLinux": make_constructor(
+        "LocalLinuxManager",
+        LocalLinuxManager,
+        {
+            "app": str,
+            "local_path": str,
+        },
+    ),
+}
+
+
 def build_executor_picker(hosts: Dict[str, Host], ephemerals: Dict[str, Ephemeral[Any]]) -> Callable[[Any], Executor]:
     """Generate a function which will dispatch a dict into all known executor constructors.
 
     This function can be extended through the ``pydatatask.executor_constructors`` entrypoint.
     """
+    host_picker = make_picker("Host", hosts)
     kinds: Dict[str, Callable[[Any], Executor]] = {
-        "TempLinux": make_constructor(
-            "InProcessLocalLinuxManager",
-            InProcessLocalLinuxManager,
-            {
-                "app": str,
-                "local_path": str,
-            },
-        ),
-        "LocalLinux": make_constructor(
-            "LocalLinuxManager",
-            LocalLinuxManager,
-            {
-                "app": str,
-                "local_path": str,
-            },
-        ),
+        **_EXECUTOR_CONSTRUCTORS,
         "SSHLinux": make_constructor(
             "SSHLinuxManager",
             SSHLinuxManager,
             {
-                "host": make_picker("Host", hosts),
+                "host": host_picker,
                 "app": str,
                 "remote_path": str,
                 "ssh": make_picker("SSHConnection", ephemerals),
@@ -402,7 +520,7 @@ def build_executor_picker(hosts: Dict[str, Host], ephemerals: Dict[str, Ephemera
             "PodManager",
             PodManager,
             {
-                "host": make_picker("Host", hosts),
+                "host": host_picker,
                 "app": str,
                 "namespace": str,
                 "connection": make_picker("KubeConnection", ephemerals),
@@ -412,14 +530,14 @@ def build_executor_picker(hosts: Dict[str, Host], ephemerals: Dict[str, Ephemera
             "DockerContainerManager",
             DockerContainerManager,
             {
-                "host": make_picker("Host", hosts),
+                "host": host_picker,
                 "app": str,
                 "url": str,
             },
         ),
     }
-    for ep in entry_points(group="pydatatask.executor_constructors"):
-        maker = ep.load()
+    for ep in _cached_entry_points("pydatatask.executor_constructors"):
+        maker = _load_entry_point(ep)
         try:
             kinds.update(maker(ephemerals))
         except TypeError:
@@ -437,62 +555,65 @@ host_constructor = make_constructor(
 )
 
 
+_EPHEMERAL_CONSTRUCTORS: Dict[str, Callable[[Any], Ephemeral[Any]]] = {
+    "S3Connection": make_constructor(
+        "S3Connection",
+        _build_s3_connection,
+        {
+            "endpoint": str,
+            "username": str,
+            "password": str,
+        },
+    ),
+    "DockerRegistry": make_constructor(
+        "DockerRegistry",
+        _build_docker_connection,
+        {
+            "domain": str,
+            "username": str,
+            "password": str,
+            "config_file": str,
+            "default_config_file": parse_bool,
+        },
+    ),
+    "MongoDatabase": make_constructor(
+        "MongoDatabase",
+        _build_mongo_connection,
+        {
+            "url": str,
+            "database": str,
+        },
+    ),
+    "SSHConnection": make_constructor(
+        "SSHConnection",
+        _build_ssh_connection,
+        {
+            "hostname": str,
+            "username": str,
+            "password": str,
+            "key": str,
+            "port": int,
+        },
+    ),
+    "KubeConnection": make_constructor(
+        "KubeConnection",
+        kube_connect,
+        {
+            "config_file": str,
+            "context": str,
+        },
+    ),
+}
+
+
 def build_ephemeral_picker() -> Callable[[Any], Ephemeral[Any]]:
     """Generate a function which will dispatch a dict into all known ephemeral constructors.
 
     This function can be extended through the ``pydatatask.ephemeral_constructors`` entrypoint.
     """
-    kinds = {
-        "S3Connection": make_constructor(
-            "S3Connection",
-            _build_s3_connection,
-            {
-                "endpoint": str,
-                "username": str,
-                "password": str,
-            },
-        ),
-        "DockerRegistry": make_constructor(
-            "DockerRegistry",
-            _build_docker_connection,
-            {
-                "domain": str,
-                "username": str,
-                "password": str,
-                "config_file": str,
-                "default_config_file": parse_bool,
-            },
-        ),
-        "MongoDatabase": make_constructor(
-            "MongoDatabase",
-            _build_mongo_connection,
-            {
-                "url": str,
-                "database": str,
-            },
-        ),
-        "SSHConnection": make_constructor(
-            "SSHConnection",
-            _build_ssh_connection,
-            {
-                "hostname": str,
-                "username": str,
-                "password": str,
-                "key": str,
-                "port": int,
-            },
-        ),
-        "KubeConnection": make_constructor(
-            "KubeConnection",
-            kube_connect,
-            {
-                "config_file": str,
-                "context": str,
-            },
-        ),
-    }
-    for ep in entry_points(group="pydatatask.ephemeral_constructors"):
-        maker = ep.load()
+    kinds = dict(_EPHEMERAL_CONSTRUCTORS)
+    for ep in _cached_entry_points("pydatatask.ephemeral_constructors"):
+        maker = _load_entry_point(ep)
         try:
             kinds.update(maker())
         except TypeError:
@@ -503,6 +624,25 @@ def build_ephemeral_picker() -> Callable[[Any], Ephemeral[Any]]:
 link_kind_constructor = make_enum_constructor(LinkKind)
 
 
+def _parse_optional_str(thing: Any) -> Optional[str]:
+    return None if thing is None else str(thing)
+
+
+_LINK_SCHEMA: Dict[str, Any] = {
+    "kind": link_kind_constructor,
+    "key": _parse_optional_str,
+    "multi_meta": _parse_optional_str,
+    "is_input": parse_bool,
+    "is_output": parse_bool,
+    "is_status": parse_bool,
+    "inhibits_start": parse_bool,
+    "required_for_start": parse_bool,
+    "inhibits_output": parse_bool,
+    "required_for_output": parse_bool,
+}
+_environ_constructor = make_dict_parser("environ", str, str)
+
+
 def build_task_picker(
     repos: Dict[str, Repository],
     executors: Dict[str, Executor],
@@ -513,22 +653,10 @@ def build_task_picker(
 
     This function can be extended through the ``pydatatask.task_constructors`` entrypoint.
     """
-    link_constructor = make_typeddict_constructor(
-        "Link",
-        {
-            "repo": make_picker("Repository", repos),
-            "kind": link_kind_constructor,
-            "key": lambda thing: None if thing is None else str(thing),
-            "multi_meta": lambda thing: None if thing is None else str(thing),
-            "is_input": parse_bool,
-            "is_output": parse_bool,
-            "is_status": parse_bool,
-            "inhibits_start": parse_bool,
-            "required_for_start": parse_bool,
-            "inhibits_output": parse_bool,
-            "required_for_output": parse_bool,
-        },
-    )
+    repo_picker = make_picker("Repository", repos)
+    executor_picker = make_picker("Executor", executors)
+    quota_picker = make_picker("QuotaManager", quotas)
+    link_constructor = make_typeddict_constructor("Link", {**_LINK_SCHEMA, "repo": repo_picker})
     links_constructor = make_dict_parser("links", str, link_constructor)
     kinds = {
         "Process": make_annotated_constructor(
@@ -537,21 +665,19 @@ def build_task_picker(
             {
                 "name": str,
                 "template": str,
-                "executor": make_picker("Executor", executors),
-                "quota_manager": make_picker("QuotaManager", quotas),
+                "executor": executor_picker,
+                "quota_manager": quota_picker,
                 "job_quota": quota_constructor,
-                "pids": make_picker("Repository", repos),
+                "pids": repo_picker,
                 "window": timedelta_constructor,
                 "timeout": timedelta_constructor,
-                "environ": make_dict_parser("environ", str, str),
+                "environ": _environ_constructor,
                 "long_running": parse_bool,
-                "done": make_picker("Repository", repos),
-                "stdin": make_picker("Repository", repos),
-                "stdout": make_picker("Repository", repos),
-                "stderr": lambda thing: pydatatask.task.STDOUT
-                if thing == "STDOUT"
-                else make_picker("Repository", repos)(thing),
-                "ready": make_picker("Repository", repos),
+                "done": repo_picker,
+                "stdin": repo_picker,
+                "stdout": repo_picker,
+                "stderr": lambda thing: pydatatask.task.STDOUT if thing == "STDOUT" else repo_picker(thing),
+                "ready": repo_picker,
                 "links": links_constructor,
             },
         ),
@@ -560,15 +686,15 @@ def build_task_picker(
             KubeTask,
             {
                 "name": str,
-                "executor": make_picker("Executor", executors),
-                "quota_manager": make_picker("QuotaManager", quotas),
+                "executor": executor_picker,
+                "quota_manager": quota_picker,
                 "template": str,
-                "logs": make_picker("Repository", repos),
-                "done": make_picker("Repository", repos),
+                "logs": repo_picker,
+                "done": repo_picker,
                 "window": timedelta_constructor,
                 "timeout": timedelta_constructor,
-                "env": make_dict_parser("environ", str, str),
-                "ready": make_picker("Repository", repos),
+                "env": _environ_constructor,
+                "ready": repo_picker,
                 "links": links_constructor,
                 "long_running": parse_bool,
             },
@@ -580,16 +706,16 @@ def build_task_picker(
                 "name": str,
                 "image": str,
                 "template": str,
-                "executor": make_picker("Executor", executors),
+                "executor": executor_picker,
                 "entrypoint": make_list_parser("entrypoint", str),
-                "quota_manager": make_picker("QuotaManager", quotas),
+                "quota_manager": quota_picker,
                 "job_quota": quota_constructor,
                 "window": timedelta_constructor,
                 "timeout": timedelta_constructor,
-                "environ": make_dict_parser("environ", str, str),
-                "logs": make_picker("Repository", repos),
-                "done": make_picker("Repository", repos),
-                "ready": make_picker("Repository", repos),
+                "environ": _environ_constructor,
+                "logs": repo_picker,
+                "done": repo_picker,
+                "ready": repo_picker,
                 "links": links_constructor,
                 "privileged": parse_bool,
                 "tty": parse_bool,
@@ -597,8 +723,8 @@ def build_task_picker(
             },
         ),
     }
-    for ep in entry_points(group="pydatatask.task_constructors"):
-        maker = ep.load()
+    for ep in _cached_entry_points("pydatatask.task_constructors"):
+        maker = _load_entry_point(ep)
         try:
             kinds.update(maker(repos, quotas, ephemerals))
         except TypeError:
@@ -607,12 +733,15 @@ def build_task_picker(
 
     def constructor(name, thing):
         executable = thing.pop("executable")
-        executable["args"].update(thing)
-        executable["args"]["name"] = name
-        links = links_constructor(executable["args"].pop("links", {}) or {})
+        args = executable["args"]
+        args.update(thing)
+        args["name"] = name
+        raw_links = args.pop("links", None)
+        links = links_constructor(raw_links) if raw_links else None
         task = dispatcher(executable)
-        for linkname, link in links.items():
-            task.link(linkname, **link)
+        if links:
+            for linkname, link in links.items():
+                task.link(linkname, **link)
         return task
 
     return constructor
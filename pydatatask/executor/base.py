@@ -22,6 +22,8 @@ class Executor:
     Provides nothing other than the ability to upcast to other executor types.
     """
 
+    __slots__ = ()
+
     def to_process_manager(self) -> "proc_manager.AbstractProcessManager":
         """Convert this executor into one that will run processes on the same machine.
 
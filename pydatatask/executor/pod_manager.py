@@ -68,6 +68,8 @@ def kube_connect(
 class PodManager(Executor):
     """A pod manager allows multiple tasks to share a connection to a kubernetes cluster and manage pods on it."""
 
+    __slots__ = ("_host", "app", "namespace", "_connection", "_base_selector")
+
     def to_pod_manager(self) -> "PodManager":
         return self
 
@@ -92,6 +94,7 @@ class PodManager(Executor):
         self.app = app
         self.namespace = namespace
         self._connection = connection
+        self._base_selector = f"app={app}"
 
     @property
     def host(self):
@@ -148,12 +151,14 @@ class PodManager(Executor):
 
     async def query(self, job=None, task=None) -> List[V1Pod]:
         """Return a list of pods labeled for this podman's app and (optional) the given job and task."""
-        selectors = ["app=" + self.app]
-        if job is not None:
-            selectors.append("job=" + job)
-        if task is not None:
-            selectors.append("task=" + task.replace("_", "-"))
-        selector = ",".join(selectors)
+        if job is None and task is None:
+            selector = self._base_selector
+        elif task is None:
+            selector = f"{self._base_selector},job={job}"
+        elif job is None:
+            selector = f"{self._base_selector},task={task.replace('_', '-')}"
+        else:
+            selector = f"{self._base_selector},job={job},task={task.replace('_', '-')}"
         return (await self.v1.list_namespaced_pod(self.namespace, label_selector=selector)).items
 
     async def delete(self, pod: V1Pod):
@@ -27,7 +27,6 @@ import sys
 from aiohttp import web
 import aiofiles
 import aioshutil
-import asyncssh
 import psutil
 import yaml
 
@@ -40,6 +39,8 @@ from pydatatask.session import Ephemeral
 from ..utils import _StderrIsStdout
 
 if TYPE_CHECKING:
+    import asyncssh
+
     from ..utils import AReadStreamManager, AReadText, AWriteStreamManager, AWriteText
 
 __all__ = ("AbstractProcessManager", "LocalLinuxManager", "SSHLinuxManager")
@@ -281,16 +282,18 @@ class SSHLinuxFile:
     Probably don't instantiate this directly.
     """
 
-    def __init__(self, path: Union[Path, str], mode: Literal["r", "w", "rb", "wb"], ssh: asyncssh.SSHClientConnection):
+    def __init__(
+        self, path: Union[Path, str], mode: Literal["r", "w", "rb", "wb"], ssh: "asyncssh.SSHClientConnection"
+    ):
         self.path = Path(path)
         self.mode = mode
         self.ssh = ssh
         self.sftp_mgr: Optional[AsyncContextManager] = None
-        self.sftp: Optional[asyncssh.SFTPClient] = None
+        self.sftp: Optional["asyncssh.SFTPClient"] = None
         self.fp_mgr: Optional[AsyncContextManager] = None
-        self.fp: Optional[asyncssh.SFTPClientFile] = None
+        self.fp: Optional["asyncssh.SFTPClientFile"] = None
 
-    async def __aenter__(self) -> asyncssh.SFTPClientFile:
+    async def __aenter__(self) -> "asyncssh.SFTPClientFile":
         self.sftp_mgr = self.ssh.start_sftp_client()
         self.sftp = await self.sftp_mgr.__aenter__()
         self.fp_mgr = self.sftp.open(self.path, self.mode)
@@ -331,7 +334,7 @@ class SSHLinuxManager(AbstractProcessManager):
     def __init__(
         self,
         app: str,
-        ssh: Ephemeral[asyncssh.SSHClientConnection],
+        ssh: Ephemeral["asyncssh.SSHClientConnection"],
         host: Host,
         remote_path: Union[Path, str] = "/tmp/pydatatask",
     ):
@@ -344,7 +347,7 @@ class SSHLinuxManager(AbstractProcessManager):
         return self._host
 
     @property
-    def ssh(self) -> asyncssh.SSHClientConnection:
+    def ssh(self) -> "asyncssh.SSHClientConnection":
         """The `asyncssh.SSHClientConnection` instance associated.
 
         Will fail if the connection is provided by an unopened Session.
@@ -9,17 +9,22 @@ Typical usage is to construct a :class:`QuotaManager` and pass it to a task cons
     quota = pydatatask.QuotaManager(pydatatask.Quota.parse(cpu='1000m', mem='1Gi'))
     task = pydatatask.ProcessTask("my_task", localhost, quota, ...)
 """
-from typing import Awaitable, Callable, List, Optional, Union
+from typing import Awaitable, Callable, Iterable, List, Mapping, Optional, Union
 from asyncio import Lock
 from dataclasses import dataclass, field
 from decimal import Decimal
 from enum import Enum, auto
+import functools
 
 from kubernetes.utils import parse_quantity
 import psutil
 
 __all__ = ("QuotaType", "Quota", "QuotaManager", "parse_quantity", "localhost_quota_manager")
 
+# Resource quantities are drawn from a small set of repeated strings (e.g. "100m", "1Gi"), and parsing them through
+# Decimal is comparatively expensive, so memoize the results. Decimals are immutable, so sharing them is safe.
+_parse_quantity_cached = functools.lru_cache(maxsize=1024)(parse_quantity)
+
 
 class QuotaType(Enum):
     """An enum class indicating a type of resource.
@@ -59,7 +64,18 @@ class Quota:
         """Construct a :class:`Quota` instance by parsing the given quantities of CPU, memory, and launches."""
         if launches is None:
             launches = 999999999
-        return Quota(cpu=parse_quantity(cpu), mem=parse_quantity(mem), launches=int(launches))
+        return Quota(cpu=_parse_quantity_cached(cpu), mem=_parse_quantity_cached(mem), launches=int(launches))
+
+    @staticmethod
+    def parse_requests(requests: Iterable[Mapping[str, str]], launches: int = 0) -> "Quota":
+        """Construct a :class:`Quota` instance by summing the CPU and memory of each of the given kubernetes
+        container resource requests."""
+        requests = list(requests)
+        return Quota(
+            cpu=sum((_parse_quantity_cached(r["cpu"]) for r in requests), Decimal(0)),
+            mem=sum((_parse_quantity_cached(r["memory"]) for r in requests), Decimal(0)),
+            launches=launches,
+        )
 
     def __add__(self, other: "Quota"):
         return Quota(cpu=self.cpu + other.cpu, mem=self.mem + other.mem, launches=self.launches + other.launches)
@@ -68,7 +84,7 @@ class Quota:
         return Quota(cpu=self.cpu * other, mem=self.mem * other, launches=self.launches * other)
 
     def __sub__(self, other: "Quota"):
-        return self + other * -1
+        return Quota(cpu=self.cpu - other.cpu, mem=self.mem - other.mem, launches=self.launches - other.launches)
 
     def excess(self, limit: "Quota") -> Optional[QuotaType]:
         """Determine if these resources are over a given limit.
@@ -1,9 +1,8 @@
 """This module contains repositories and other classes for interacting with S3-compatible bucket stores."""
 
-from typing import Dict, Literal, Optional, overload
+from typing import TYPE_CHECKING, Dict, Literal, Optional, overload
 import io
 
-from types_aiobotocore_s3.client import S3Client
 import botocore.exceptions
 
 from pydatatask.host import LOCAL_HOST, Host
@@ -12,6 +11,9 @@ from pydatatask.utils import AReadText, AWriteText
 
 from .base import BlobRepository, Repository, YamlMetadataRepository, job_getter
 
+if TYPE_CHECKING:
+    from types_aiobotocore_s3.client import S3Client
+
 
 class S3BucketBinaryWriter:
     """A class for streaming (or buffering) byte data to be written to an `S3BucketRepository`."""
@@ -76,7 +78,7 @@ class S3BucketRepositoryBase(Repository):
 
     def __init__(
         self,
-        client: Ephemeral[S3Client],
+        client: Ephemeral["S3Client"],
         bucket: str,
         endpoints: Optional[Dict[Optional[Host], str]] = None,
     ):
@@ -116,7 +118,7 @@ class S3BucketRepository(S3BucketRepositoryBase, BlobRepository):
 
     def __init__(
         self,
-        client: Ephemeral[S3Client],
+        client: Ephemeral["S3Client"],
         bucket: str,
         prefix: str = "",
         suffix: str = "",
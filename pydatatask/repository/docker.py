@@ -1,16 +1,18 @@
 """This module contains repositories for interacting with docker registries."""
 
-from typing import Callable
+from typing import TYPE_CHECKING, Callable
 import base64
 import hashlib
 import os
 
 import aiohttp.client_exceptions
-import docker_registry_client_async
 import dxf
 
 from .base import Repository, job_getter
 
+if TYPE_CHECKING:
+    import docker_registry_client_async
+
 
 class DockerRepository(Repository):
     """A docker repository is, well, an actual docker repository hosted in some registry somewhere.
@@ -20,7 +22,7 @@ class DockerRepository(Repository):
 
     def __init__(
         self,
-        registry: Callable[[], docker_registry_client_async.dockerregistryclientasync.DockerRegistryClientAsync],
+        registry: Callable[[], "docker_registry_client_async.dockerregistryclientasync.DockerRegistryClientAsync"],
         domain: str,
         repository: str,
     ):
@@ -40,7 +42,7 @@ class DockerRepository(Repository):
         return (self.domain, self.repository)
 
     @property
-    def registry(self) -> docker_registry_client_async.dockerregistryclientasync.DockerRegistryClientAsync:
+    def registry(self) -> "docker_registry_client_async.dockerregistryclientasync.DockerRegistryClientAsync":
         """The ``docker_registry_client_async`` client object.
 
         If this is provided by an unopened session, raise an error.
@@ -48,8 +50,11 @@ class DockerRepository(Repository):
         return self._registry()
 
     async def unfiltered_iter(self):
+        # pylint: disable-next=import-outside-toplevel
+        from docker_registry_client_async.imagename import ImageName
+
         try:
-            image = docker_registry_client_async.imagename.ImageName(self.repository, endpoint=self.domain)
+            image = ImageName(self.repository, endpoint=self.domain)
             tags = (await self.registry.get_tags(image)).tags["tags"]
             if tags is None:
                 return
@@ -1,18 +1,18 @@
 """This module contains repositories for interacting with MongoDB as a data store."""
-from typing import Any, Callable, Dict, Optional
-
-import motor.core
-import motor.motor_asyncio
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
 
 from .base import MetadataRepository, job_getter
 
+if TYPE_CHECKING:
+    import motor.core
+
 
 class MongoMetadataRepository(MetadataRepository):
     """A metadata repository using a mongodb collection as the backing store."""
 
     def __init__(
         self,
-        database: Callable[[], motor.core.AgnosticCollection],
+        database: Callable[[], "motor.core.AgnosticCollection"],
         collection: str,
     ):
         """
@@ -30,7 +30,7 @@ class MongoMetadataRepository(MetadataRepository):
         return f"<{type(self).__name__} {self._collection}>"
 
     @property
-    def collection(self) -> motor.core.AgnosticCollection:
+    def collection(self) -> "motor.core.AgnosticCollection":
         """The motor async collection data will be stored in.
 
         If this is provided by an unopened session, raise an error.
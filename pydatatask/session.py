@@ -29,7 +29,9 @@ If a session is passed to a pipeline, it will be opened and closed when the pipe
 Sessions cannot be opened more than once. But this doesn't have to be the way! If you have a use case, complain in a
 GitHub issue, and I'll see what can be done.
 """
-from typing import AsyncIterable, Callable, TypeVar
+from typing import AsyncContextManager, AsyncIterator, Callable, Dict, Optional, TypeVar
+from contextlib import AsyncExitStack, asynccontextmanager
+import asyncio
 
 __all__ = ("Session", "Ephemeral")
 
@@ -43,17 +45,21 @@ class Session:
     See module docs for usage information.
     """
 
+    __slots__ = ("_ephemeral_defs", "ephemerals", "_stack")
+
     def __init__(self):
-        self._ephemeral_defs = {}
+        self._ephemeral_defs: Dict[str, Callable[[], AsyncContextManager]] = {}
         self.ephemerals = {}
+        self._stack: Optional[AsyncExitStack] = None
 
-    def ephemeral(self, manager: Callable[[], AsyncIterable[T]]) -> Ephemeral[T]:
+    def ephemeral(self, manager: Callable[[], AsyncIterator[T]]) -> Ephemeral[T]:
         """Decorator for ephemeral resource managers.
 
         Should be called with an async function that will yield exactly one object, the live constructed resource, and
-        then tear that resource down on completion.
+        then tear that resource down on completion. Ephemerals are initialized concurrently, so a manager must not
+        call another ephemeral before its yield.
         """
-        self._ephemeral_defs[manager.__name__] = manager()
+        self._ephemeral_defs[manager.__name__] = asynccontextmanager(manager)
 
         def inner():
             if manager.__name__ not in self.ephemerals:
@@ -66,12 +72,50 @@ class Session:
         await self.open()
 
     async def open(self):
-        """Open the session, initializing all the ephemerals.
+        """Open the session, initializing all the ephemerals concurrently.
 
         This is automatically called when entering an ``async with session:`` block.
         """
-        for name, manager in self._ephemeral_defs.items():
-            self.ephemerals[name] = await manager.__anext__()
+        names = list(self._ephemeral_defs)
+        managers = [self._ephemeral_defs[name]() for name in names]
+        # pylint: disable-next=unnecessary-dunder-call
+        tasks = [asyncio.ensure_future(manager.__aenter__()) for manager in managers]
+
+        error: Optional[BaseException] = None
+        try:
+            if tasks:
+                await asyncio.wait(tasks)
+        except asyncio.CancelledError as e:
+            # Let every setup settle so that the ones which did finish can be torn down below.
+            error = e
+            for task in tasks:
+                task.cancel()
+            await asyncio.wait(tasks)
+
+        stack = AsyncExitStack()
+        for name, manager, task in zip(names, managers, tasks):
+            if task.cancelled():
+                if error is None:
+                    error = asyncio.CancelledError()
+                continue
+            exc = task.exception()
+            if exc is not None:
+                if error is None:
+                    error = exc
+            else:
+                self.ephemerals[name] = task.result()
+                stack.push_async_exit(manager)
+
+        if error is not None:
+            try:
+                await stack.aclose()
+            except BaseException:
+                # The setup failure is the interesting one; the teardown failure rides along as its context.
+                raise error  # pylint: disable=raise-missing-from
+            finally:
+                self.ephemerals.clear()
+            raise error
+        self._stack = stack
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         await self.close()
@@ -81,11 +125,9 @@ class Session:
 
         This is automatically called when exiting an ``async with session:`` block.
         """
-        for name, manager in self._ephemeral_defs.items():
-            try:
-                await manager.__anext__()
-            except StopAsyncIteration:
-                pass
-            else:
-                print("Warning: ephemeral has more than one yield")
-            self.ephemerals.pop(name)
+        stack, self._stack = self._stack, None
+        try:
+            if stack is not None:
+                await stack.aclose()
+        finally:
+            self.ephemerals.clear()
@@ -835,8 +835,7 @@ class KubeTask(Task):
             for pod in await self.podman.query(task=self.name):
                 if pod.metadata.creation_timestamp > cutoff:
                     usage += Quota(launches=1)
-                for container in pod.spec.containers:
-                    usage += Quota.parse(container.resources.requests["cpu"], container.resources.requests["memory"], 0)
+                usage += Quota.parse_requests(container.resources.requests for container in pod.spec.containers)
         except ApiException as e:
             if e.reason != "Forbidden":
                 raise
@@ -862,13 +861,7 @@ class KubeTask(Task):
         spec = manifest["spec"]
         spec["restartPolicy"] = "Never"
 
-        request = Quota(launches=1)
-        for container in spec["containers"]:
-            request += Quota.parse(
-                container["resources"]["requests"]["cpu"],
-                container["resources"]["requests"]["memory"],
-                0,
-            )
+        request = Quota.parse_requests((container["resources"]["requests"] for container in spec["containers"]), 1)
 
         limit = await self.quota_manager.reserve(request)
         if limit is None:
@@ -904,9 +897,7 @@ class KubeTask(Task):
 
     async def delete(self, pod: V1Pod):
         """Kill a pod and relinquish its resources without marking the task as complete."""
-        request = Quota(launches=1)
-        for container in pod.spec.containers:
-            request += Quota.parse(container.resources.requests["cpu"], container.resources.requests["memory"], 0)
+        request = Quota.parse_requests((container.resources.requests for container in pod.spec.containers), 1)
         await self.podman.delete(pod)
         await self.quota_manager.relinquish(request)
 
@@ -0,0 +1,125 @@
+from datetime import timedelta
+import base64
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from importlib_metadata import EntryPoint
+
+from pydatatask.declarative import (
+    _load_docker_config,
+    _load_entry_point,
+    link_kind_constructor,
+    make_dict_parser,
+    make_dispatcher,
+    make_list_parser,
+    make_picker,
+    make_typeddict_constructor,
+    parse_bool,
+    quota_constructor,
+    timedelta_constructor,
+)
+from pydatatask.quota import Quota
+from pydatatask.task import LinkKind
+
+
+class TestDeclarative(unittest.TestCase):
+    def test_entry_point_cache(self):
+        dumps = EntryPoint("thing", "json:dumps", "pydatatask.test_constructors")
+        loads = EntryPoint("thing", "json:loads", "pydatatask.test_constructors")
+        assert _load_entry_point(dumps) is json.dumps
+        assert _load_entry_point(loads) is json.loads
+        assert _load_entry_point(EntryPoint("thing", "json:dumps", "pydatatask.test_constructors")) is json.dumps
+
+    def test_lazy_client_imports(self):
+        clients = ["motor", "aiobotocore", "asyncssh", "docker_registry_client_async"]
+        script = f"import sys, pydatatask.declarative; print([m for m in {clients!r} if m in sys.modules])"
+        assert subprocess.check_output([sys.executable, "-c", script], text=True).strip() == "[]"
+
+    def test_typeddict(self):
+        constructor = make_typeddict_constructor("Thing", {"a": int, "b": str})
+        assert constructor({"a": "1", "b": 2}) == {"a": 1, "b": "2"}
+        assert constructor({}) == {}
+        with self.assertRaisesRegex(ValueError, "Invalid argument to Thing: c"):
+            constructor({"a": 1, "c": 2})
+        with self.assertRaisesRegex(ValueError, "mapping"):
+            constructor([])
+
+    def test_collections(self):
+        assert make_dict_parser("d", str, int)({1: "2"}) == {"1": 2}
+        assert make_list_parser("l", int)(["1", 2]) == [1, 2]
+        with self.assertRaises(ValueError):
+            make_dict_parser("d", str, int)([])
+        with self.assertRaises(ValueError):
+            make_list_parser("l", int)({})
+
+    def test_parse_bool(self):
+        assert parse_bool(True) is True
+        assert parse_bool(0) is False
+        assert parse_bool("Yes") is True
+        assert parse_bool("FALSE") is False
+        with self.assertRaisesRegex(ValueError, "Invalid bool value maybe"):
+            parse_bool("maybe")
+        with self.assertRaisesRegex(ValueError, "not valid as a bool"):
+            parse_bool(1.0)
+
+    def test_enum(self):
+        assert link_kind_constructor("InputRepo") is LinkKind.InputRepo
+        assert link_kind_constructor(None) is None
+        with self.assertRaisesRegex(ValueError, "not a valid member"):
+            link_kind_constructor("name")
+        with self.assertRaisesRegex(ValueError, "must be instantiated by a string"):
+            link_kind_constructor(1)
+
+    def test_dispatcher(self):
+        dispatcher = make_dispatcher("Thing", {"a": lambda args: ("a", args)})
+        assert dispatcher({"cls": "a", "args": {"x": 1}}) == ("a", {"x": 1})
+        assert dispatcher({"cls": "a"}) == ("a", {})
+        with self.assertRaisesRegex(ValueError, "must be a mapping"):
+            dispatcher(["a"])
+        with self.assertRaisesRegex(ValueError, "must provide the cls name"):
+            dispatcher({"args": {}})
+        with self.assertRaisesRegex(ValueError, "b is not a valid member of Thing"):
+            dispatcher({"cls": "b"})
+
+    def test_docker_config_cache(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "config.json")
+            for i, auth in enumerate(["a:b", "c:d"]):
+                with open(path, "w", encoding="utf-8") as fp:
+                    json.dump({"auths": {"example.com": {"auth": base64.b64encode(auth.encode()).decode()}}}, fp)
+                os.utime(path, ns=(i, i))
+                config = _load_docker_config(path, os.stat(path).st_mtime_ns)
+                assert base64.b64decode(config["auths"]["example.com"]["auth"]).decode() == auth
+
+    def test_memoized(self):
+        q1 = quota_constructor({"cpu": "100m", "mem": "1Gi"})
+        q2 = quota_constructor({"mem": "1Gi", "cpu": "100m"})
+        assert q1 == q2 == Quota.parse("100m", "1Gi")
+        assert q1 is not q2
+        assert quota_constructor({"cpu": 1, "mem": "1Gi"}) == Quota.parse(1, "1Gi")
+        with self.assertRaises(ValueError):
+            quota_constructor({"cpu": True, "mem": "1Gi"})
+        assert timedelta_constructor({"minutes": "5"}) == timedelta(minutes=5)
+        with self.assertRaisesRegex(ValueError, "Invalid argument to timedelta: years"):
+            timedelta_constructor({"years": 1})
+
+    def test_picker(self):
+        options = {"a": 1, "b": None}
+        picker = make_picker("Thing", options)
+        assert picker("a") == 1
+        assert picker("b") is None
+        assert picker(None) is None
+        with self.assertRaisesRegex(ValueError, "c is not a valid option"):
+            picker("c")
+        with self.assertRaisesRegex(ValueError, "must provide a str"):
+            picker(["a"])
+        with self.assertRaisesRegex(ValueError, "at least one Thing"):
+            make_picker("Thing", {})("a")
+
+
+if __name__ == "__main__":
+    unittest.main()
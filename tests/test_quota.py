@@ -0,0 +1,42 @@
+from decimal import Decimal
+import unittest
+
+from pydatatask.quota import Quota
+
+
+class TestQuota(unittest.TestCase):
+    def test_parse_requests(self):
+        requests = [
+            {"cpu": "100m", "memory": "1Gi"},
+            {"cpu": "1", "memory": "256Mi"},
+            {"cpu": "250m", "memory": "512M"},
+        ]
+        for launches in (0, 1):
+            expected = Quota(launches=launches)
+            for request in requests:
+                expected += Quota.parse(request["cpu"], request["memory"], 0)
+            assert Quota.parse_requests(requests, launches) == expected
+            assert Quota.parse_requests(iter(requests), launches) == expected
+
+        assert Quota.parse_requests(requests) == Quota(
+            cpu=Decimal("1.35"), mem=Decimal(2**30 + 2**28 + 512 * 10**6), launches=0
+        )
+        assert Quota.parse_requests([]) == Quota(launches=0)
+        assert Quota.parse_requests([], 1) == Quota(launches=1)
+
+    def test_sub(self):
+        a = Quota.parse("2", "3Gi", 5)
+        b = Quota.parse("500m", "1Gi", 2)
+        assert a - b == Quota(cpu=Decimal("1.5"), mem=Decimal(2 * 2**30), launches=3)
+        assert a - b == a + b * -1
+        assert b - a == Quota(cpu=Decimal("-1.5"), mem=Decimal(-2 * 2**30), launches=-3)
+        assert a - Quota() == Quota(cpu=a.cpu, mem=a.mem, launches=4)
+
+        r = Quota.parse(1, 1, 100)
+        r += Quota.parse(2, 3, 0)
+        r -= Quota.parse(1, 1, 0)
+        assert r == Quota.parse(2, 3, 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
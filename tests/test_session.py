@@ -0,0 +1,124 @@
+import asyncio
+import unittest
+
+import pydatatask
+
+
+class TestSession(unittest.IsolatedAsyncioTestCase):
+    async def test_lifecycle(self):
+        session = pydatatask.Session()
+        events = []
+
+        @session.ephemeral
+        async def foo():
+            events.append("open foo")
+            yield "foo"
+            events.append("close foo")
+
+        @session.ephemeral
+        async def bar():
+            events.append("open bar")
+            yield "bar"
+            events.append("close bar")
+
+        with self.assertRaises(Exception):
+            foo()
+        async with session:
+            assert foo() == "foo"
+            assert bar() == "bar"
+        with self.assertRaises(Exception):
+            bar()
+        assert events == ["open foo", "open bar", "close bar", "close foo"]
+
+    async def test_partial_open(self):
+        session = pydatatask.Session()
+        events = []
+
+        @session.ephemeral
+        async def foo():
+            try:
+                yield "foo"
+            finally:
+                events.append("close foo")
+
+        @session.ephemeral
+        async def bar():
+            raise ValueError("bar")
+            yield  # pylint: disable=unreachable
+
+        with self.assertRaises(ValueError):
+            await session.open()
+        assert events == ["close foo"]
+        assert not session.ephemerals
+
+    async def test_concurrent_open(self):
+        session = pydatatask.Session()
+        foo_started = asyncio.Event()
+        bar_started = asyncio.Event()
+
+        @session.ephemeral
+        async def foo():
+            foo_started.set()
+            await bar_started.wait()
+            yield "foo"
+
+        @session.ephemeral
+        async def bar():
+            bar_started.set()
+            await foo_started.wait()
+            yield "bar"
+
+        # Each ephemeral waits on the other before yielding, so this deadlocks unless startup overlaps.
+        await asyncio.wait_for(session.open(), timeout=5)
+        assert foo() == "foo"
+        assert bar() == "bar"
+        await session.close()
+
+    async def test_open_teardown_failure(self):
+        session = pydatatask.Session()
+
+        @session.ephemeral
+        async def foo():
+            yield "foo"
+            raise KeyError("foo teardown")
+
+        @session.ephemeral
+        async def bar():
+            raise ValueError("bar setup")
+            yield  # pylint: disable=unreachable
+
+        with self.assertRaisesRegex(ValueError, "bar setup") as cm:
+            await session.open()
+        assert isinstance(cm.exception.__context__, KeyError)
+        assert not session.ephemerals
+
+    async def test_cancelled_open(self):
+        session = pydatatask.Session()
+        events = []
+        foo_started = asyncio.Event()
+
+        @session.ephemeral
+        async def foo():
+            foo_started.set()
+            try:
+                yield "foo"
+            finally:
+                events.append("close foo")
+
+        @session.ephemeral
+        async def bar():
+            await asyncio.Event().wait()
+            yield "bar"
+
+        opening = asyncio.ensure_future(session.open())
+        await foo_started.wait()
+        await asyncio.sleep(0)
+        opening.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await opening
+        assert events == ["close foo"]
+        assert not session.ephemerals
+
+
+if __name__ == "__main__":
+    unittest.main()